@@ -4,17 +4,21 @@ This module provides functionality similar to the PowerShell ImportToSQLDatabase
 with focus on AWS Lambda and Glue compatibility.
 """
 
+import atexit
+import mmap
 import os
 import csv
+import shutil
+import subprocess
 import tempfile
+import threading
+import concurrent.futures
 import time
 import logging
 from typing import List, Dict, Any, Optional, Union, Tuple
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
 import pyodbc
 import pandas as pd
-from sqlalchemy import create_engine, text
 
 # Configure logging
 logger = logging.getLogger('sql_import')
@@ -24,6 +28,112 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+# No record here formats thread or process info; skip the per-record
+# current_thread()/getpid() lookups entirely
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Mapping of SQL Server data types to BCP format file column types;
+# anything not listed falls back to SQLVARYCHAR
+_SQL_TO_BCP = {
+    'INT': 'SQLINT',
+    'BIGINT': 'SQLBIGINT',
+    'SMALLINT': 'SQLSMALLINT',
+    'TINYINT': 'SQLTINYINT',
+    'BIT': 'SQLBIT',
+    'DECIMAL': 'SQLDECIMAL',
+    'NUMERIC': 'SQLNUMERIC',
+    'MONEY': 'SQLMONEY',
+    'SMALLMONEY': 'SQLSMALLMONEY',
+    'FLOAT': 'SQLFLT8',
+    'REAL': 'SQLFLT4',
+    'DATETIME': 'SQLDATETIME',
+    'DATETIME2': 'SQLDATETIME',
+    'DATE': 'SQLDATE',
+    'TIME': 'SQLTIME',
+    'DATETIMEOFFSET': 'SQLDATETIMEOFFSET',
+    'SMALLDATETIME': 'SQLSMALLDATETIME',
+}
+
+# Server-side quoting for a possibly schema-qualified table name; PARSENAME
+# splits on the dot so dbo.MyTable quotes as [dbo].[MyTable] rather than
+# the invalid one-part name [dbo.MyTable]
+_QUOTED_TABLE_SQL = (
+    "DECLARE @table sysname = ?; "
+    "DECLARE @quoted nvarchar(300) = "
+    "ISNULL(QUOTENAME(PARSENAME(@table, 2)) + N'.', N'') "
+    "+ QUOTENAME(PARSENAME(@table, 1)); "
+)
+
+
+def _quote_identifier(name: str) -> str:
+    """Bracket-quote a single SQL Server identifier, escaping ] as ]]."""
+    return "[" + name.replace("]", "]]") + "]"
+
+
+def _quote_table(table: str) -> str:
+    """Bracket-quote a possibly schema-qualified table name part by part."""
+    return ".".join(_quote_identifier(part) for part in table.split("."))
+
+# SQL Server type families with an unambiguous parser-side type; anything
+# not listed is read as a string and converted by the server. DECIMAL/MONEY
+# stay strings deliberately so no precision is lost in a float round-trip
+_SQL_TO_PANDAS = {
+    'INT': 'Int64',
+    'BIGINT': 'Int64',
+    'SMALLINT': 'Int64',
+    'TINYINT': 'Int64',
+    'FLOAT': 'float64',
+    'REAL': 'float64',
+}
+
+_SQL_TO_ARROW = {
+    'INT': 'int64',
+    'BIGINT': 'int64',
+    'SMALLINT': 'int64',
+    'TINYINT': 'int64',
+    'FLOAT': 'float64',
+    'REAL': 'float64',
+}
+
+
+def _column_converters(columns: List[Dict[str, Any]]) -> Tuple:
+    """
+    Build per-column parser callables (or None for pass-through strings),
+    indexed by column position, from table column metadata.
+    """
+    converters = []
+    for column in columns:
+        data_type = column['data_type'].upper()
+        if data_type in ('INT', 'BIGINT', 'SMALLINT', 'TINYINT'):
+            converters.append(int)
+        elif data_type in ('FLOAT', 'REAL'):
+            converters.append(float)
+        else:
+            converters.append(None)
+    return tuple(converters)
+
+
+# Format files generated this process, keyed on (delimiter, column
+# signature); identical schemas reuse the same file instead of rebuilding
+# the XML and writing a new temp file per import
+_format_file_cache: Dict[Tuple, str] = {}
+
+
+def _cleanup_format_files() -> None:
+    """Remove cached format files when the process exits."""
+    for path in _format_file_cache.values():
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    _format_file_cache.clear()
+
+
+atexit.register(_cleanup_format_files)
+
+
 class SqlImport:
     """Class for importing delimited files into SQL Server tables."""
     
@@ -54,19 +164,48 @@ class SqlImport:
         self.conn = None
         self.batch_size = 5000
         self.timeout = 600
+        self._columns_cache: Dict[str, List[Dict[str, Any]]] = {}
         
+    def __enter__(self) -> "SqlImport":
+        """Open the shared connection when entering a with-block."""
+        if not self.conn:
+            self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the shared connection when leaving a with-block."""
+        self.disconnect()
+
     def connect(self) -> None:
         """Establish connection to SQL Server."""
         try:
+            # MARS adds per-request overhead this single-statement
+            # workload never uses
+            tuning = "MARS_Connection=No;"
             if self.trusted_connection:
-                conn_str = f"DRIVER={{{self.driver}}};SERVER={self.server};DATABASE={self.database};Trusted_Connection=yes;"
+                conn_str = f"DRIVER={{{self.driver}}};SERVER={self.server};DATABASE={self.database};Trusted_Connection=yes;{tuning}"
             else:
-                conn_str = f"DRIVER={{{self.driver}}};SERVER={self.server};DATABASE={self.database};UID={self.username};PWD={self.password}"
-            
-            self.conn = pyodbc.connect(conn_str)
-            logger.info(f"Successfully connected to {self.server}/{self.database}")
+                conn_str = f"DRIVER={{{self.driver}}};SERVER={self.server};DATABASE={self.database};UID={self.username};PWD={self.password};{tuning}"
+
+            # 32 KB TDS packets move 8x more data per round-trip than the
+            # 4 KB default; SQL_ATTR_PACKET_SIZE (112) must be set before
+            # connecting since the packet size is negotiated at login, and
+            # the ODBC driver silently ignores it as a connection-string
+            # keyword
+            self.conn = pyodbc.connect(conn_str, autocommit=False,
+                                       attrs_before={112: 32768})
+            self.conn.timeout = self.timeout
+
+            # Set session options once per connection instead of paying a
+            # round-trip before each statement; XACT_ABORT lets the server
+            # fast-path rollback when a bulk operation fails
+            cursor = self.conn.cursor()
+            cursor.execute("SET ARITHABORT ON; SET NOCOUNT ON; SET XACT_ABORT ON;")
+            cursor.close()
+
+            logger.info("Successfully connected to %s/%s", self.server, self.database)
         except Exception as e:
-            logger.error(f"Failed to connect to SQL Server: {e}")
+            logger.error("Failed to connect to SQL Server: %s", e)
             raise
     
     def disconnect(self) -> None:
@@ -74,6 +213,7 @@ class SqlImport:
         if self.conn:
             self.conn.close()
             self.conn = None
+            self._columns_cache.clear()
             logger.info("Database connection closed")
     
     def get_table_columns(self, table: str) -> List[Dict[str, Any]]:
@@ -86,9 +226,13 @@ class SqlImport:
         Returns:
             List of dictionaries containing column information
         """
+        # Serve repeat lookups from the cache; it is cleared on disconnect
+        if table in self._columns_cache:
+            return self._columns_cache[table]
+
         if not self.conn:
             self.connect()
-            
+
         cursor = self.conn.cursor()
         query = """
         SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH 
@@ -106,113 +250,244 @@ class SqlImport:
                 'max_length': max_length
             })
         cursor.close()
-        
-        logger.info(f"Found {len(columns)} columns in table {table}")
+
+        logger.info("Found %s columns in table %s", len(columns), table)
+        self._columns_cache[table] = columns
         return columns
     
-    def truncate_table(self, table: str) -> None:
+    def get_clustered_key_columns(self, table: str) -> List[str]:
+        """
+        Get the key columns of a table's clustered index, if any.
+
+        Args:
+            table: Table name
+
+        Returns:
+            List of key column names in key order (empty if the table is a heap)
+        """
+        if not self.conn:
+            self.connect()
+
+        cursor = self.conn.cursor()
+        query = """
+        SELECT c.name
+        FROM sys.indexes i
+        JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+        JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+        WHERE i.object_id = OBJECT_ID(?) AND i.type = 1 AND ic.is_included_column = 0
+        ORDER BY ic.key_ordinal
+        """
+        cursor.execute(query, table)
+        key_columns = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+
+        return key_columns
+
+    def truncate_table(self, table: str, commit: bool = True) -> None:
         """
         Truncate a table.
-        
+
         Args:
             table: Table name
+            commit: Whether to commit immediately; pass False when the caller
+                manages the enclosing transaction
         """
         if not self.conn:
             self.connect()
-            
+
         cursor = self.conn.cursor()
         try:
-            cursor.execute(f"TRUNCATE TABLE {table}")
-            self.conn.commit()
-            logger.info(f"Table {table} truncated successfully")
+            # Quote the table name server-side; table can come from user
+            # input (e.g. a Lambda event)
+            cursor.execute(
+                _QUOTED_TABLE_SQL +
+                "DECLARE @stmt nvarchar(400) = N'TRUNCATE TABLE ' + @quoted; "
+                "EXEC sp_executesql @stmt;",
+                table)
+            if commit:
+                self.conn.commit()
+            logger.info("Table %s truncated successfully", table)
         except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error truncating table: {e}")
+            if commit:
+                self.conn.rollback()
+            logger.error("Error truncating table: %s", e)
             raise
         finally:
             cursor.close()
     
-    def disable_constraints(self, table: str) -> None:
+    def disable_constraints(self, table: str, commit: bool = True) -> None:
         """
         Disable foreign key constraints on a table.
-        
+
         Args:
             table: Table name
+            commit: Whether to commit immediately; pass False when the caller
+                manages the enclosing transaction
         """
         if not self.conn:
             self.connect()
-            
+
         cursor = self.conn.cursor()
         try:
-            cursor.execute(f"ALTER TABLE {table} NOCHECK CONSTRAINT ALL")
-            self.conn.commit()
-            logger.info(f"Foreign key constraints disabled on {table}")
+            cursor.execute(
+                _QUOTED_TABLE_SQL +
+                "DECLARE @stmt nvarchar(400) = N'ALTER TABLE ' + @quoted "
+                "+ N' NOCHECK CONSTRAINT ALL'; "
+                "EXEC sp_executesql @stmt;",
+                table)
+            if commit:
+                self.conn.commit()
+            logger.info("Foreign key constraints disabled on %s", table)
         except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error disabling constraints: {e}")
+            if commit:
+                self.conn.rollback()
+            logger.error("Error disabling constraints: %s", e)
         finally:
             cursor.close()
     
-    def enable_constraints(self, table: str) -> None:
+    def enable_constraints(self, table: str, trusted: bool = True, commit: bool = True) -> None:
         """
         Enable foreign key constraints on a table.
-        
+
         Args:
             table: Table name
+            trusted: Whether to validate existing rows (WITH CHECK) so the
+                constraints stay trusted by the query optimizer; disabling
+                skips the validation scan but leaves them not-trusted
+            commit: Whether to commit immediately; pass False when the caller
+                manages the enclosing transaction
         """
         if not self.conn:
             self.connect()
-            
+
         cursor = self.conn.cursor()
         try:
-            cursor.execute(f"ALTER TABLE {table} CHECK CONSTRAINT ALL")
-            self.conn.commit()
-            logger.info(f"Foreign key constraints re-enabled on {table}")
+            if trusted:
+                cursor.execute(
+                    _QUOTED_TABLE_SQL +
+                    "DECLARE @stmt nvarchar(400) = N'ALTER TABLE ' + @quoted "
+                    "+ N' WITH CHECK CHECK CONSTRAINT ALL'; "
+                    "EXEC sp_executesql @stmt;",
+                    table)
+            else:
+                logger.warning("Re-enabling constraints on %s without validation; "
+                               "they will be marked not-trusted", table)
+                cursor.execute(
+                    _QUOTED_TABLE_SQL +
+                    "DECLARE @stmt nvarchar(400) = N'ALTER TABLE ' + @quoted "
+                    "+ N' CHECK CONSTRAINT ALL'; "
+                    "EXEC sp_executesql @stmt;",
+                    table)
+            if commit:
+                self.conn.commit()
+            logger.info("Foreign key constraints re-enabled on %s", table)
         except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error enabling constraints: {e}")
+            if commit:
+                self.conn.rollback()
+            logger.error("Error enabling constraints: %s", e)
         finally:
             cursor.close()
     
-    def disable_indexes(self, table: str) -> None:
+    def drop_indexes(self, table: str, commit: bool = True) -> List[Dict[str, Any]]:
         """
-        Disable non-clustered indexes on a table.
-        
+        Capture and drop the non-clustered indexes on a table.
+
+        Dropping before a bulk load and recreating afterwards is faster than
+        ALTER INDEX DISABLE/REBUILD on large tables, since the sort and build
+        happen once against the fully loaded data.
+
         Args:
             table: Table name
+            commit: Whether to commit immediately; pass False when the caller
+                manages the enclosing transaction
+
+        Returns:
+            List of index definition dictionaries for recreate_indexes
         """
         if not self.conn:
             self.connect()
-            
+
         cursor = self.conn.cursor()
+        query = """
+        SELECT i.name, i.is_unique, i.filter_definition,
+               c.name, ic.is_descending_key, ic.is_included_column
+        FROM sys.indexes i
+        JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+        JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+        WHERE i.object_id = OBJECT_ID(?) AND i.type = 2
+          AND i.is_primary_key = 0 AND i.is_unique_constraint = 0
+        ORDER BY i.name, ic.is_included_column, ic.key_ordinal
+        """
         try:
-            cursor.execute(f"ALTER INDEX ALL ON {table} DISABLE")
-            self.conn.commit()
-            logger.info(f"Non-clustered indexes disabled on {table}")
+            cursor.execute(query, table)
+            indexes = {}
+            for name, is_unique, filter_definition, column_name, is_descending, is_included in cursor.fetchall():
+                index = indexes.setdefault(name, {
+                    'name': name,
+                    'is_unique': bool(is_unique),
+                    'filter': filter_definition,
+                    'key_columns': [],
+                    'include_columns': []
+                })
+                column = _quote_identifier(column_name)
+                if is_included:
+                    index['include_columns'].append(column)
+                else:
+                    index['key_columns'].append(
+                        f"{column} DESC" if is_descending else f"{column} ASC")
+
+            for name in indexes:
+                cursor.execute(
+                    f"DROP INDEX {_quote_identifier(name)} ON {_quote_table(table)}")
+            if commit:
+                self.conn.commit()
+            logger.info("Dropped %s non-clustered indexes on %s", len(indexes), table)
+            return list(indexes.values())
         except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error disabling indexes: {e}")
+            if commit:
+                self.conn.rollback()
+            logger.error("Error dropping indexes: %s", e)
+            raise
         finally:
             cursor.close()
-    
-    def rebuild_indexes(self, table: str) -> None:
+
+    def recreate_indexes(self, table: str, index_definitions: List[Dict[str, Any]],
+                         commit: bool = True) -> None:
         """
-        Rebuild indexes on a table.
-        
+        Recreate non-clustered indexes captured by drop_indexes.
+
         Args:
             table: Table name
+            index_definitions: Index definitions returned by drop_indexes
+            commit: Whether to commit immediately; pass False when the caller
+                manages the enclosing transaction
         """
         if not self.conn:
             self.connect()
-            
+
         cursor = self.conn.cursor()
         try:
-            cursor.execute(f"ALTER INDEX ALL ON {table} REBUILD")
-            self.conn.commit()
-            logger.info(f"Non-clustered indexes rebuilt on {table}")
+            for index in index_definitions:
+                unique = "UNIQUE " if index['is_unique'] else ""
+                create_sql = (f"CREATE {unique}NONCLUSTERED INDEX "
+                              f"{_quote_identifier(index['name'])} "
+                              f"ON {_quote_table(table)} "
+                              f"({', '.join(index['key_columns'])})")
+                if index['include_columns']:
+                    create_sql += f" INCLUDE ({', '.join(index['include_columns'])})"
+                if index['filter']:
+                    create_sql += f" WHERE {index['filter']}"
+                # Parallelize the one-time sort and keep it out of the user db
+                create_sql += " WITH (SORT_IN_TEMPDB = ON, MAXDOP = 0)"
+                cursor.execute(create_sql)
+            if commit:
+                self.conn.commit()
+            logger.info("Recreated %s non-clustered indexes on %s", len(index_definitions), table)
         except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error rebuilding indexes: {e}")
+            if commit:
+                self.conn.rollback()
+            logger.error("Error recreating indexes: %s", e)
+            raise
         finally:
             cursor.close()
     
@@ -225,10 +500,21 @@ class SqlImport:
         Args:
             columns: List of column information dictionaries
             delimiter: Field delimiter character
-            
+
         Returns:
             Path to the created format file
         """
+        # Identical schemas produce identical format files; serve repeats
+        # from the process-wide cache, cleaned up at exit
+        cache_key = (delimiter, tuple((column['name'],
+                                       column['data_type'],
+                                       column['max_length'])
+                                      for column in columns))
+        cached = _format_file_cache.get(cache_key)
+        if cached and os.path.exists(cached):
+            logger.info("Reusing cached format file: %s", cached)
+            return cached
+
         # Create XML format file
         root = ET.Element("BCPFORMAT")
         root.set("xmlns", "http://schemas.microsoft.com/sqlserver/2004/bulkload/format")
@@ -260,56 +546,19 @@ class SqlImport:
             
             # Map SQL data types to appropriate BCP format types
             data_type = column['data_type'].upper()
-            if data_type == "INT":
-                xsi_type = "SQLINT"
-            elif data_type == "BIGINT":
-                xsi_type = "SQLBIGINT"
-            elif data_type == "SMALLINT":
-                xsi_type = "SQLSMALLINT"
-            elif data_type == "TINYINT":
-                xsi_type = "SQLTINYINT"
-            elif data_type == "BIT":
-                xsi_type = "SQLBIT"
-            elif data_type == "DECIMAL":
-                xsi_type = "SQLDECIMAL"
-            elif data_type == "NUMERIC":
-                xsi_type = "SQLNUMERIC"
-            elif data_type == "MONEY":
-                xsi_type = "SQLMONEY"
-            elif data_type == "SMALLMONEY":
-                xsi_type = "SQLSMALLMONEY"
-            elif data_type == "FLOAT":
-                xsi_type = "SQLFLT8"
-            elif data_type == "REAL":
-                xsi_type = "SQLFLT4"
-            elif data_type == "DATETIME":
-                xsi_type = "SQLDATETIME"
-            elif data_type == "DATETIME2":
-                xsi_type = "SQLDATETIME"
-            elif data_type == "DATE":
-                xsi_type = "SQLDATE"
-            elif data_type == "TIME":
-                xsi_type = "SQLTIME"
-            elif data_type == "DATETIMEOFFSET":
-                xsi_type = "SQLDATETIMEOFFSET"
-            elif data_type == "SMALLDATETIME":
-                xsi_type = "SQLSMALLDDATETIME"
-            else:
-                xsi_type = "SQLVARYCHAR"  # Default to VARCHAR for text and other types
-                
-            col.set("xsi:type", xsi_type)
+            col.set("xsi:type", _SQL_TO_BCP.get(data_type, "SQLVARYCHAR"))
         
-        # Convert to pretty-printed XML
-        rough_string = ET.tostring(root, 'utf-8')
-        reparsed = minidom.parseString(rough_string)
-        xml_str = reparsed.toprettyxml(indent="  ")
+        # Pretty-print in place; no need to round-trip through a DOM
+        ET.indent(root, space="  ")
+        xml_str = ET.tostring(root, encoding='unicode')
         
         # Write to temp file
         fd, format_file = tempfile.mkstemp(suffix='.fmt')
         with os.fdopen(fd, 'w') as f:
             f.write(xml_str)
-        
-        logger.info(f"Created format file: {format_file}")
+
+        _format_file_cache[cache_key] = format_file
+        logger.info("Created format file: %s", format_file)
         return format_file
     
     def preprocess_csv(self, 
@@ -333,95 +582,155 @@ class SqlImport:
         """
         # Create a temporary file for the processed data
         fd, temp_file = tempfile.mkstemp(suffix='.csv')
-        
-        logger.info(f"Preprocessing CSV file: {csv_file}")
-        
-        line_count = 0
+        os.close(fd)
+
+        logger.info("Preprocessing CSV file: %s", csv_file)
+
+        # When no field fixups are needed, copy the file in large binary
+        # blocks instead of parsing it; line iteration decodes and re-encodes
+        # every byte for nothing
+        if not handle_trailing_delimiters:
+            with open(csv_file, 'rb', buffering=1 << 22) as infile, \
+                 open(temp_file, 'wb') as outfile:
+                if skip_header:
+                    infile.readline()
+                    logger.info("Skipping header row")
+                shutil.copyfileobj(infile, outfile, length=1 << 20)
+
+            logger.info("Created preprocessed file: %s", temp_file)
+            return temp_file
+
         column_count = len(columns)
-        
-        with open(csv_file, 'r', newline='') as infile, os.fdopen(fd, 'w', newline='') as outfile:
-            # Skip header if needed
-            if skip_header:
-                next(infile)
-                logger.info("Skipping header row")
-            
-            # Process remaining content
-            for line in infile:
-                line_count += 1
-                
-                if handle_trailing_delimiters:
-                    # Count delimiters in the line
-                    delimiter_count = line.count(delimiter)
-                    
-                    # Ensure we have the right number of delimiters (should be column_count - 1)
-                    if delimiter_count < (column_count - 1):
-                        # Add missing delimiters
-                        line = line.rstrip('\r\n') + (delimiter * ((column_count - 1) - delimiter_count)) + '\n'
-                    elif delimiter_count > (column_count - 1):
-                        # Parse fields and take only the columns we need
-                        reader = csv.reader([line], delimiter=delimiter)
-                        fields = next(reader)
-                        
-                        # Rebuild the line with the correct number of delimiters
-                        if len(fields) > 0:
-                            new_line = fields[0]
-                            for i in range(1, column_count):
-                                if i < len(fields):
-                                    new_line += delimiter + fields[i]
-                                else:
-                                    new_line += delimiter
-                            line = new_line + '\n'
-                
-                outfile.write(line)
-                
-                # Show progress every 10,000 lines
-                if line_count % 10000 == 0:
-                    logger.info(f"Processed {line_count} lines...")
-                    
-        logger.info(f"Created preprocessed file with {line_count} lines: {temp_file}")
+        col_names = [column['name'] for column in columns]
+
+        # Let the pandas C parser normalize field counts instead of rebuilding
+        # each line in Python; names/usecols pin every row to the table's shape,
+        # padding short rows and dropping extra trailing fields
+        df = pd.read_csv(csv_file,
+                         sep=delimiter,
+                         header=None,
+                         names=col_names,
+                         usecols=list(range(column_count)),
+                         dtype=str,
+                         engine='c',
+                         na_filter=False,
+                         skiprows=1 if skip_header else 0)
+
+        df.to_csv(temp_file,
+                  sep=delimiter,
+                  header=False,
+                  index=False,
+                  lineterminator='\n')
+
+        logger.info("Created preprocessed file with %s lines: %s", len(df), temp_file)
         return temp_file
     
-    def execute_bulk_insert(self, 
-                          table: str, 
-                          csv_file: str, 
-                          format_file: str) -> None:
+    def execute_bulk_insert(self,
+                          table: str,
+                          csv_file: str,
+                          format_file: Optional[str] = None,
+                          delimiter: str = ",",
+                          first_row: int = 1,
+                          rows_per_batch: Optional[int] = None,
+                          kilobytes_per_batch: Optional[int] = None,
+                          order_by: Optional[str] = None,
+                          check_constraints: bool = False,
+                          keep_nulls: bool = True,
+                          keep_identity: bool = False,
+                          data_source: Optional[str] = None,
+                          commit: bool = True) -> None:
         """
         Execute a BULK INSERT statement to load data from a CSV file.
-        
+
+        The file path is resolved by the SQL Server itself, so it must be a
+        path the server can see (local disk or UNC share) or, with
+        data_source, a key in an external data source such as Azure blob
+        storage or an S3 bucket (SQL Server 2022+).
+
         Args:
             table: Table name
-            csv_file: Path to CSV file
-            format_file: Path to format file
+            csv_file: Path to CSV file as seen by the server, or the object
+                key within data_source
+            format_file: Path to format file; when None the server parses the
+                file with its built-in CSV format and delimiter instead
+            delimiter: Field delimiter, used only when format_file is None
+            first_row: First row of the file to load (2 skips a header row)
+            rows_per_batch: Approximate row count hint so the server can size
+                the batch and preallocate log space
+            kilobytes_per_batch: Approximate kilobytes per batch hint
+            order_by: Column list (e.g. "Id ASC") asserting the file is
+                pre-sorted on the clustered key, enabling the sorted bulk-load
+                optimization
+            check_constraints: Whether to validate CHECK and FK constraints
+                per row during the load; off by default to match the bulk-load
+                pattern of disabling validation while loading trusted data
+            keep_nulls: Whether empty fields load as NULL instead of the
+                column default
+            keep_identity: Whether identity values from the file are kept
+                instead of being regenerated by the server
+            data_source: Name of an EXTERNAL DATA SOURCE (created with
+                TYPE = BLOB_STORAGE) the server should read the file from,
+                for imports where client and server share no filesystem
+            commit: Whether to commit immediately; pass False when the caller
+                manages the enclosing transaction
         """
         if not self.conn:
             self.connect()
-            
+
         cursor = self.conn.cursor()
-        cursor.execute(f"SET ARITHABORT ON")
-        
-        # Build BULK INSERT command
+
+        # Build BULK INSERT command; a format file path is resolved on the
+        # server just like the data file, so remote loads use the built-in
+        # CSV parser instead
+        if format_file:
+            options = [f"FORMATFILE = '{format_file}'"]
+        else:
+            options = ["FORMAT = 'CSV'", f"FIELDTERMINATOR = '{delimiter}'"]
+        options += [
+            f"FIRSTROW = {first_row}",
+            "TABLOCK",
+            "MAXERRORS = 0"
+        ]
+        if rows_per_batch:
+            options.append(f"ROWS_PER_BATCH = {rows_per_batch}")
+        if kilobytes_per_batch:
+            options.append(f"KILOBYTES_PER_BATCH = {kilobytes_per_batch}")
+        if order_by:
+            options.append(f"ORDER ({order_by})")
+        # CHECK_CONSTRAINTS is off unless asked for; per-row validation is
+        # the slow path and constraints can be re-validated WITH CHECK after
+        # the load instead
+        if check_constraints:
+            options.append("CHECK_CONSTRAINTS")
+        if keep_nulls:
+            options.append("KEEPNULLS")
+        if keep_identity:
+            options.append("KEEPIDENTITY")
+        if data_source:
+            options.append("DATA_SOURCE = '" + data_source.replace("'", "''") + "'")
+
+        options_sql = ",\n            ".join(options)
         bulk_insert_sql = f"""
-        BULK INSERT {table}
-        FROM '{csv_file}'
+        BULK INSERT {_quote_table(table)}
+        FROM '{csv_file.replace("'", "''")}'
         WITH (
-            FORMATFILE = '{format_file}',
-            FIRSTROW = 1,
-            TABLOCK,
-            MAXERRORS = 0
+            {options_sql}
         )
         """
         
-        logger.info(f"Executing SQL Command: {bulk_insert_sql}")
+        logger.info("Executing SQL Command: %s", bulk_insert_sql)
         
         try:
             cursor.execute(bulk_insert_sql)
-            self.conn.commit()
+            if commit:
+                self.conn.commit()
             logger.info("BULK INSERT completed successfully")
         except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error during BULK INSERT: {e}")
+            if commit:
+                self.conn.rollback()
+            logger.error("Error during BULK INSERT: %s", e)
             if hasattr(e, 'args') and len(e.args) > 1:
-                logger.error(f"Error details: {e.args[1]}")
+                logger.error("Error details: %s", e.args[1])
             raise
         finally:
             cursor.close()
@@ -434,12 +743,26 @@ class SqlImport:
                           truncate: bool = False, 
                           handle_trailing_delimiters: bool = False,
                           manage_constraints: bool = False,
-                          manage_indexes: bool = False) -> None:
+                          manage_indexes: bool = False,
+                          rows_per_batch: Optional[int] = None,
+                          kilobytes_per_batch: Optional[int] = None,
+                          presorted: bool = False,
+                          check_constraints: bool = False,
+                          keep_nulls: bool = True,
+                          keep_identity: bool = False,
+                          data_source: Optional[str] = None) -> None:
         """
         Import data from a CSV file into a SQL Server table using BULK INSERT.
-        
+
+        BULK INSERT opens the file on the SQL Server, so csv_file must be a
+        server-visible path (local disk or UNC share). When client and server
+        share no filesystem, pass data_source naming an EXTERNAL DATA SOURCE
+        (Azure blob storage, or an S3 bucket on SQL Server 2022+) and give
+        csv_file as the object key; use import_with_bcp to stream a
+        client-local file instead.
+
         Args:
-            csv_file: Path to CSV file
+            csv_file: Path to CSV file, or the object key within data_source
             table: Table name
             delimiter: Field delimiter character
             skip_header: Whether to skip the header row
@@ -447,77 +770,329 @@ class SqlImport:
             handle_trailing_delimiters: Whether to handle trailing delimiters
             manage_constraints: Whether to disable and re-enable constraints
             manage_indexes: Whether to disable and rebuild indexes
+            rows_per_batch: Approximate row count hint passed to BULK INSERT
+            kilobytes_per_batch: Approximate kilobytes-per-batch hint
+            presorted: Whether the file is pre-sorted on the table's clustered
+                key, enabling the ORDER bulk-load optimization
+            check_constraints: Whether to validate CHECK and FK constraints
+                per row during the load
+            keep_nulls: Whether empty fields load as NULL instead of the
+                column default
+            keep_identity: Whether identity values from the file are kept
+            data_source: Name of an EXTERNAL DATA SOURCE the server reads the
+                file from; skips client-side preprocessing
         """
         start_time = time.time()
-        
+
         try:
             # Connect to database
             if not self.conn:
                 self.connect()
-            
+
+            # The whole sequence below (truncate, constraint/index management,
+            # BULK INSERT) runs in one transaction; pyodbc opens it implicitly
+            # with autocommit off, and the single commit at the end replaces a
+            # log flush per step and keeps a mid-sequence crash from leaving
+            # the table half-loaded with constraints or indexes missing
+
             # Truncate if requested
             if truncate:
-                self.truncate_table(table)
-                
+                self.truncate_table(table, commit=False)
+
             # Get column information
             columns = self.get_table_columns(table)
-            
+
             # Disable constraints if requested
             if manage_constraints:
-                self.disable_constraints(table)
-                
-            # Disable indexes if requested
+                self.disable_constraints(table, commit=False)
+
+            # Drop indexes if requested, keeping their definitions for after
+            # the load
+            index_definitions = []
             if manage_indexes:
-                self.disable_indexes(table)
-                
-            # Preprocess CSV if needed
-            if skip_header or handle_trailing_delimiters:
+                index_definitions = self.drop_indexes(table, commit=False)
+
+            # Preprocess CSV only when field counts need fixing; a plain
+            # header skip is handled natively by FIRSTROW without rewriting
+            # the file. A remote object behind a data source cannot be
+            # preprocessed (or described by a local format file) at all
+            first_row = 1
+            format_file = None
+            if data_source:
+                processed_csv = csv_file
+                if skip_header:
+                    first_row = 2
+            elif handle_trailing_delimiters:
                 processed_csv = self.preprocess_csv(
-                    csv_file, 
-                    columns, 
-                    delimiter, 
-                    skip_header, 
+                    csv_file,
+                    columns,
+                    delimiter,
+                    skip_header,
                     handle_trailing_delimiters
                 )
+                format_file = self.create_format_file(columns, delimiter)
             else:
                 processed_csv = csv_file
-                
-            # Create format file
-            format_file = self.create_format_file(columns, delimiter)
-            
+                if skip_header:
+                    first_row = 2
+                format_file = self.create_format_file(columns, delimiter)
+
+            # Only assert sort order when the caller vouches for it and the
+            # table actually has a clustered key
+            order_by = None
+            if presorted:
+                key_columns = self.get_clustered_key_columns(table)
+                if key_columns:
+                    order_by = ", ".join(
+                        f"{_quote_identifier(name)} ASC" for name in key_columns)
+
             # Execute BULK INSERT
-            self.execute_bulk_insert(table, processed_csv, format_file)
-            
-            # Cleanup temporary files
+            self.execute_bulk_insert(table, processed_csv, format_file,
+                                     delimiter=delimiter,
+                                     first_row=first_row,
+                                     rows_per_batch=rows_per_batch,
+                                     kilobytes_per_batch=kilobytes_per_batch,
+                                     order_by=order_by,
+                                     check_constraints=check_constraints,
+                                     keep_nulls=keep_nulls,
+                                     keep_identity=keep_identity,
+                                     data_source=data_source,
+                                     commit=False)
+
+            # Cleanup temporary files; format files stay behind for reuse by
+            # later imports of the same schema and are removed at exit
             if processed_csv != csv_file:
                 os.remove(processed_csv)
-                logger.info(f"Removed temporary CSV file: {processed_csv}")
-                
-            os.remove(format_file)
-            logger.info(f"Removed format file: {format_file}")
-            
-            # Rebuild indexes if requested
+                logger.info("Removed temporary CSV file: %s", processed_csv)
+
+            # Recreate indexes if requested
             if manage_indexes:
-                self.rebuild_indexes(table)
-                
+                self.recreate_indexes(table, index_definitions, commit=False)
+
             # Re-enable constraints if requested
             if manage_constraints:
-                self.enable_constraints(table)
-                
+                self.enable_constraints(table, commit=False)
+
+            # One commit for the whole import
+            self.conn.commit()
+
             # Calculate statistics
             end_time = time.time()
             total_time = end_time - start_time
-            
-            logger.info(f"Import completed successfully in {total_time:.2f} seconds")
-            
+
+            logger.info("Import completed successfully in %.2f seconds", total_time)
+
+        except Exception as e:
+            if self.conn:
+                self.conn.rollback()
+            logger.error("Error during import: %s", e)
+            raise
+
+    def import_from_stream(self,
+                           csv_stream: Union[str, Any],
+                           table: str,
+                           delimiter: str = ",",
+                           skip_header: bool = False,
+                           truncate: bool = False,
+                           batch_size: Optional[int] = None,
+                           commit_size: int = 1) -> None:
+        """
+        Import data from a text stream or file using batched multi-row INSERTs.
+
+        The source is consumed incrementally with csv.reader, so peak memory
+        is one batch of rows regardless of input size — no temp file on disk
+        and no DataFrame materialization. Suited to feeding an S3 response
+        body straight into the database from Lambda or Glue, and to local
+        files where pandas would only add a DataFrame round-trip.
+
+        Args:
+            csv_stream: Text-mode iterable of CSV lines (e.g. an S3 body
+                wrapped in io.TextIOWrapper), or a path to a local CSV file
+            table: Table name
+            delimiter: Field delimiter character
+            skip_header: Whether to skip the header row
+            truncate: Whether to truncate the table before import
+            batch_size: Rows per executemany batch (defaults to
+                self.batch_size)
+            commit_size: Batches per commit; higher values amortize the log
+                flush across more rows at the cost of a longer rollback on
+                failure
+        """
+        start_time = time.time()
+
+        if not self.conn:
+            self.connect()
+        if batch_size is None:
+            batch_size = self.batch_size
+
+        if truncate:
+            self.truncate_table(table)
+
+        columns = self.get_table_columns(table)
+        placeholders = ", ".join("?" for _ in columns)
+        column_list = ", ".join(
+            _quote_identifier(column['name']) for column in columns)
+        insert_sql = (f"INSERT INTO {_quote_table(table)} ({column_list}) "
+                      f"VALUES ({placeholders})")
+
+        # Per-column parsers derived once from the table schema; numeric
+        # fields bind as numbers instead of strings the server re-converts
+        converters = _column_converters(columns)
+
+        # A path is opened with a 1 MB buffer so the reader issues few,
+        # large read syscalls
+        opened_here = isinstance(csv_stream, str)
+        if opened_here:
+            csv_stream = open(csv_stream, newline='', buffering=1 << 20)
+
+        reader = csv.reader(csv_stream, delimiter=delimiter)
+        if skip_header:
+            next(reader, None)
+
+        cursor = self.conn.cursor()
+        # Ship each batch as one parameter-array round-trip instead of one
+        # INSERT per row
+        cursor.fast_executemany = True
+
+        total_rows = 0
+        batches_since_commit = 0
+        batch: List[List[Optional[str]]] = []
+        try:
+            # zip would silently drop trailing fields from an overlong row
+            # and a short row would only fail later with an opaque
+            # parameter-count error, so check the width up front
+            expected_fields = len(columns)
+            for row_number, row in enumerate(reader, 2 if skip_header else 1):
+                if len(row) != expected_fields:
+                    raise ValueError(
+                        f"Row {row_number} has {len(row)} fields; "
+                        f"expected {expected_fields} for table {table}")
+                batch.append([
+                    None if field == ''
+                    else (convert(field) if convert else field)
+                    for convert, field in zip(converters, row)
+                ])
+                if len(batch) >= batch_size:
+                    cursor.executemany(insert_sql, batch)
+                    total_rows += len(batch)
+                    batch = []
+                    batches_since_commit += 1
+                    if batches_since_commit >= commit_size:
+                        self.conn.commit()
+                        batches_since_commit = 0
+                    logger.info("Processed %s rows...", total_rows)
+
+            if batch:
+                cursor.executemany(insert_sql, batch)
+                total_rows += len(batch)
+            self.conn.commit()
+
+            total_time = time.time() - start_time
+            logger.info("Stream import completed successfully. Total rows: %s, "
+                        "Time: %.2f seconds", total_rows, total_time)
         except Exception as e:
-            logger.error(f"Error during import: {e}")
+            self.conn.rollback()
+            logger.error("Error during stream import: %s", e)
             raise
         finally:
-            # Ensure connection is closed
-            self.disconnect()
+            cursor.close()
+            if opened_here:
+                csv_stream.close()
+
+    def import_with_bcp(self,
+                        csv_source: Union[str, Any],
+                        table: str,
+                        delimiter: str = ",",
+                        skip_header: bool = False,
+                        truncate: bool = False) -> None:
+        """
+        Import data by streaming it through the bcp utility's stdin.
+
+        Unlike BULK INSERT, bcp reads the data on the client, so this works
+        when the client and SQL Server share no filesystem (e.g. AWS Lambda
+        against on-prem SQL) without staging the file anywhere the server
+        can see. csv_source may be a local path or an open file object
+        (binary or text, such as an S3 response body), which is piped
+        straight into bcp with no intermediate disk use.
+
+        Args:
+            csv_source: Path to CSV file, or a file-like object
+            table: Table name
+            delimiter: Field delimiter character
+            skip_header: Whether to skip the header row
+            truncate: Whether to truncate the table before import
+
+        Raises:
+            FileNotFoundError: If the bcp executable is not on PATH
+            RuntimeError: If bcp exits with a non-zero status
+        """
+        start_time = time.time()
+
+        if truncate:
+            self.truncate_table(table)
+
+        cmd = ['bcp', table, 'in', '/dev/stdin',
+               '-S', self.server, '-d', self.database,
+               '-c', '-t', delimiter,
+               '-b', str(self.batch_size),
+               '-h', 'TABLOCK',
+               '-m', '0']
+        if self.trusted_connection:
+            cmd.append('-T')
+        else:
+            cmd += ['-U', self.username, '-P', self.password]
+        if skip_header:
+            cmd += ['-F', '2']
+
+        if isinstance(csv_source, str):
+            source = open(csv_source, 'rb')
+        else:
+            source = csv_source
+
+        try:
+            process = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                       stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT)
+
+            # bcp reports progress per batch on stdout; drain it on a side
+            # thread so the pipe never fills up and stalls both processes
+            # against each other mid-transfer
+            output_chunks: List[bytes] = []
+            drainer = threading.Thread(
+                target=lambda: output_chunks.append(process.stdout.read()))
+            drainer.start()
+
+            try:
+                while True:
+                    block = source.read(1 << 20)
+                    if not block:
+                        break
+                    if isinstance(block, str):
+                        block = block.encode('utf-8')
+                    process.stdin.write(block)
+            except BrokenPipeError:
+                # bcp exited before consuming everything (e.g. login
+                # failure); fall through so its output is reported below
+                pass
+            finally:
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+
+            drainer.join()
+            output = b''.join(output_chunks).decode(errors='replace')
+            if process.wait() != 0:
+                logger.error("bcp failed: %s", output)
+                raise RuntimeError(f"bcp exited with status {process.returncode}")
+        finally:
+            if isinstance(csv_source, str):
+                source.close()
 
-    def import_with_pandas(self, 
+        total_time = time.time() - start_time
+        logger.info("bcp import completed successfully in %.2f seconds", total_time)
+
+    def import_with_pandas(self,
                           csv_file: str, 
                           table: str, 
                           delimiter: str = ",", 
@@ -525,8 +1100,8 @@ class SqlImport:
                           truncate: bool = False,
                           chunksize: int = 10000) -> None:
         """
-        Import data from a CSV file using pandas and SQLAlchemy for smaller files or AWS environments.
-        
+        Import data from a CSV file using chunked pandas reads for smaller files or AWS environments.
+
         Args:
             csv_file: Path to CSV file
             table: Table name
@@ -536,59 +1111,323 @@ class SqlImport:
             chunksize: Number of rows to process in each chunk
         """
         start_time = time.time()
-        
+
         try:
-            # Connect to database using SQLAlchemy
-            if self.trusted_connection:
-                conn_str = f"mssql+pyodbc://{self.server}/{self.database}?driver={self.driver.replace(' ', '+')}&trusted_connection=yes"
-            else:
-                conn_str = f"mssql+pyodbc://{self.username}:{self.password}@{self.server}/{self.database}?driver={self.driver.replace(' ', '+')}"
-            
-            engine = create_engine(conn_str)
-            
+            if not self.conn:
+                self.connect()
+
             # Truncate if requested
             if truncate:
-                with engine.connect() as connection:
-                    connection.execute(text(f"TRUNCATE TABLE {table}"))
-                logger.info(f"Table {table} truncated successfully")
-            
+                self.truncate_table(table)
+
             # Read and import CSV data
             if skip_header:
                 header_row = 0
             else:
                 header_row = None
-                
-            # Get column information to determine dtypes
+
+            # Get column information to build the insert statement once
             columns = self.get_table_columns(table)
-            
-            # Process CSV in chunks
+            placeholders = ", ".join("?" for _ in columns)
+            column_list = ", ".join(
+                _quote_identifier(column['name']) for column in columns)
+            insert_sql = (f"INSERT INTO {_quote_table(table)} ({column_list}) "
+                          f"VALUES ({placeholders})")
+
+            cursor = self.conn.cursor()
+            # Ship each chunk as one parameter-array round-trip instead of
+            # one INSERT per row
+            cursor.fast_executemany = True
+
+            # Explicit dtypes from the table schema type numeric columns in
+            # one pass; headerless files stay all-string since the reader
+            # has no names to match on
+            if header_row == 0:
+                dtypes: Any = {column['name']: _SQL_TO_PANDAS.get(column['data_type'].upper(), str)
+                               for column in columns}
+            else:
+                dtypes = str
+
+            # Hand the C parser a memory-mapped view of the file: the kernel
+            # prefetches sequentially and the parser reads page-cache bytes
+            # without a userspace copy per block
+            source: Any = csv_file
+            mapped = None
+            if os.path.getsize(csv_file) > 0:
+                with open(csv_file, 'rb') as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                source = mapped
+
+            # Process CSV in chunks: explicit dtypes skip the inference
+            # pass, and peak memory stays at one chunk of rows
             total_rows = 0
-            for chunk in pd.read_csv(csv_file, 
-                                    delimiter=delimiter, 
-                                    header=header_row,
-                                    chunksize=chunksize,
-                                    low_memory=False):
-                
-                # Insert chunk into database
-                chunk.to_sql(table, engine, if_exists='append', index=False)
-                
-                total_rows += len(chunk)
-                logger.info(f"Processed {total_rows} rows...")
-            
+            try:
+                for chunk in pd.read_csv(source,
+                                        delimiter=delimiter,
+                                        header=header_row,
+                                        dtype=dtypes,
+                                        engine='c',
+                                        chunksize=chunksize):
+
+                    # Empty fields parse as NaN; insert them as NULL
+                    rows = chunk.astype(object).where(chunk.notna(), None)
+                    cursor.executemany(insert_sql,
+                                       list(rows.itertuples(index=False, name=None)))
+                    self.conn.commit()
+
+                    total_rows += len(chunk)
+                    logger.info("Processed %s rows...", total_rows)
+            finally:
+                cursor.close()
+                if mapped is not None:
+                    mapped.close()
+
             # Calculate statistics
             end_time = time.time()
             total_time = end_time - start_time
             rows_per_second = total_rows / total_time
-            
-            logger.info(f"Import completed successfully. Total rows: {total_rows}, Time: {total_time:.2f} seconds, Rows/sec: {rows_per_second:.1f}")
-            
+
+            logger.info("Import completed successfully. Total rows: %s, Time: %.2f seconds, Rows/sec: %.1f", total_rows, total_time, rows_per_second)
+
+        except Exception as e:
+            # connect() runs inside this try; without a connection there is
+            # nothing to roll back
+            if self.conn:
+                self.conn.rollback()
+            logger.error("Error during pandas import: %s", e)
+            raise
+
+    def import_with_bcpandas(self,
+                            csv_file: str,
+                            table: str,
+                            delimiter: str = ",",
+                            skip_header: bool = False,
+                            truncate: bool = False,
+                            chunksize: int = 100000) -> None:
+        """
+        Import data from a CSV file using bcpandas, which streams each chunk
+        through the bcp.exe bulk-copy protocol instead of ODBC INSERTs.
+
+        Args:
+            csv_file: Path to CSV file
+            table: Table name
+            delimiter: Field delimiter character
+            skip_header: Whether to skip the header row
+            truncate: Whether to truncate the table before import
+            chunksize: Number of rows to read from the CSV in each chunk
+
+        Raises:
+            ImportError: If the optional bcpandas package is not installed
+        """
+        import bcpandas
+
+        start_time = time.time()
+
+        try:
+            creds = bcpandas.SqlCreds(
+                server=self.server,
+                database=self.database,
+                username=self.username,
+                password=self.password
+            )
+
+            # Truncate if requested
+            if truncate:
+                self.truncate_table(table)
+
+            if skip_header:
+                header_row = 0
+            else:
+                header_row = None
+
+            # Process CSV in chunks, each streamed via the BULK protocol
+            total_rows = 0
+            for chunk in pd.read_csv(csv_file,
+                                    delimiter=delimiter,
+                                    header=header_row,
+                                    chunksize=chunksize,
+                                    low_memory=False):
+
+                bcpandas.to_sql(chunk, table, creds,
+                                index=False,
+                                if_exists='append',
+                                batch_size=self.batch_size)
+
+                total_rows += len(chunk)
+                logger.info("Processed %s rows...", total_rows)
+
+            # Calculate statistics
+            end_time = time.time()
+            total_time = end_time - start_time
+
+            logger.info("bcpandas import completed successfully. Total rows: %s, Time: %.2f seconds", total_rows, total_time)
+
+        except Exception as e:
+            logger.error("Error during bcpandas import: %s", e)
+            raise
+
+    def import_with_dask(self,
+                         csv_file: str,
+                         table: str,
+                         delimiter: str = ",",
+                         skip_header: bool = False,
+                         truncate: bool = False,
+                         blocksize: str = "64MB",
+                         chunksize: int = 5000) -> None:
+        """
+        Import data from a CSV file using dask.dataframe for node-local
+        parallelism.
+
+        Dask partitions the file into blocksize byte ranges parsed by
+        separate workers, and to_sql(parallel=True) writes the partitions
+        concurrently over their own connections. csv_file may also be an
+        s3:// URI, which Dask reads directly without staging locally.
+
+        Args:
+            csv_file: Path to CSV file, or an s3:// URI
+            table: Table name
+            delimiter: Field delimiter character
+            skip_header: Whether the first row of the file contains headers
+            truncate: Whether to truncate the table before import
+            blocksize: Byte size of each parsed partition
+            chunksize: Rows per INSERT statement batch
+
+        Raises:
+            ImportError: If the optional dask package is not installed
+        """
+        import dask.dataframe as dd
+
+        start_time = time.time()
+
+        if truncate:
+            self.truncate_table(table)
+
+        # Workers open their own connections from a URI rather than sharing
+        # this instance's pyodbc handle
+        driver = self.driver.replace(' ', '+')
+        if self.trusted_connection:
+            uri = (f"mssql+pyodbc://@{self.server}/{self.database}"
+                   f"?driver={driver}&trusted_connection=yes")
+        else:
+            uri = (f"mssql+pyodbc://{self.username}:{self.password}"
+                   f"@{self.server}/{self.database}?driver={driver}")
+
+        columns = self.get_table_columns(table)
+        if skip_header:
+            ddf = dd.read_csv(csv_file, sep=delimiter, blocksize=blocksize,
+                              dtype=str)
+        else:
+            ddf = dd.read_csv(csv_file, sep=delimiter, blocksize=blocksize,
+                              dtype=str, header=None,
+                              names=[column['name'] for column in columns])
+
+        # SQL Server caps statements at 2100 parameters, so keep
+        # rows-per-statement below that for the multi-row INSERT path
+        insert_chunksize = min(chunksize, max(1, 2000 // max(1, len(columns))))
+
+        ddf.to_sql(table, uri=uri, if_exists='append', index=False,
+                   method='multi', chunksize=insert_chunksize, parallel=True)
+
+        total_time = time.time() - start_time
+        logger.info("Dask import completed successfully in %.2f seconds", total_time)
+
+    def import_with_arrow(self,
+                          csv_file: str,
+                          table: str,
+                          delimiter: str = ",",
+                          skip_header: bool = False,
+                          truncate: bool = False,
+                          max_chunksize: int = 50000) -> None:
+        """
+        Import data from a CSV file parsed with PyArrow's threaded CSV reader.
+
+        Arrow parses multi-threaded over 32 MB blocks into contiguous column
+        buffers, several times faster than the pandas C engine on multi-core
+        hosts; batches are then shipped via fast_executemany.
+
+        Args:
+            csv_file: Path to CSV file
+            table: Table name
+            delimiter: Field delimiter character
+            skip_header: Whether the first row of the file contains headers
+            truncate: Whether to truncate the table before import
+            max_chunksize: Maximum rows per insert batch
+
+        Raises:
+            ImportError: If the optional pyarrow package is not installed
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+
+        start_time = time.time()
+
+        if not self.conn:
+            self.connect()
+
+        if truncate:
+            self.truncate_table(table)
+
+        columns = self.get_table_columns(table)
+        placeholders = ", ".join("?" for _ in columns)
+        column_list = ", ".join(
+            _quote_identifier(column['name']) for column in columns)
+        insert_sql = (f"INSERT INTO {_quote_table(table)} ({column_list}) "
+                      f"VALUES ({placeholders})")
+
+        # A header row becomes Arrow's column names and is consumed for
+        # free; headerless files get generated names instead
+        # Explicit column types from the table schema replace Arrow's
+        # per-block inference; headerless files map by position onto the
+        # generated f0, f1, ... names
+        column_types = {}
+        for i, column in enumerate(columns):
+            data_type = column['data_type'].upper()
+            if data_type in _SQL_TO_ARROW:
+                name = column['name'] if skip_header else f"f{i}"
+                column_types[name] = _SQL_TO_ARROW[data_type]
+
+        # A memory-mapped source gives the reader a zero-copy view of the
+        # page cache instead of buffered reads
+        with pa.memory_map(csv_file, 'r') as source:
+            arrow_table = pacsv.read_csv(
+                source,
+                parse_options=pacsv.ParseOptions(delimiter=delimiter),
+                read_options=pacsv.ReadOptions(
+                    block_size=32 << 20,
+                    use_threads=True,
+                    autogenerate_column_names=not skip_header
+                ),
+                convert_options=pacsv.ConvertOptions(column_types=column_types)
+            )
+
+        cursor = self.conn.cursor()
+        cursor.fast_executemany = True
+
+        total_rows = 0
+        try:
+            for batch in arrow_table.to_batches(max_chunksize=max_chunksize):
+                rows = list(zip(*[column.to_pylist() for column in batch.columns]))
+                cursor.executemany(insert_sql, rows)
+                self.conn.commit()
+
+                total_rows += batch.num_rows
+                logger.info("Processed %s rows...", total_rows)
+
+            total_time = time.time() - start_time
+            logger.info("Arrow import completed successfully. Total rows: %s, "
+                        "Time: %.2f seconds", total_rows, total_time)
         except Exception as e:
-            logger.error(f"Error during pandas import: {e}")
+            self.conn.rollback()
+            logger.error("Error during Arrow import: %s", e)
             raise
+        finally:
+            cursor.close()
 
-    def find_problem_data(self, 
-                         csv_file: str, 
-                         table: str, 
+    def find_problem_data(self,
+                         csv_file: str,
+                         table: str,
                          delimiter: str = ",", 
                          skip_header: bool = False) -> List[Dict[str, Any]]:
         """
@@ -606,44 +1445,65 @@ class SqlImport:
         # Get column information
         columns = self.get_table_columns(table)
         problem_rows = []
-        
-        # Process CSV
-        with open(csv_file, 'r', newline='') as f:
-            reader = csv.reader(f, delimiter=delimiter)
-            
-            # Skip header if needed
-            if skip_header:
-                next(reader)
-                
-            row_num = 1 if skip_header else 0
-            
-            # Check each row
-            for row in reader:
-                row_num += 1
-                
-                # Check for length problems
-                for i in range(min(len(row), len(columns))):
-                    if row[i] != '':
-                        # Check if column has a maximum length
-                        if columns[i]['data_type'].upper() in ['VARCHAR', 'NVARCHAR', 'CHAR', 'NCHAR'] and \
-                           columns[i]['max_length'] > 0 and \
-                           len(row[i]) > columns[i]['max_length']:
-                            
-                            # Truncate data for display if too long
-                            display_data = row[i][:47] + "..." if len(row[i]) > 50 else row[i]
-                            
-                            problem_rows.append({
-                                'row_number': row_num,
-                                'column': columns[i]['name'],
-                                'data_length': len(row[i]),
-                                'max_allowed': columns[i]['max_length'],
-                                'data': display_data
-                            })
-                
-                # Provide progress output
-                if row_num % 1000 == 0:
-                    logger.info(f"Processed {row_num} rows...")
-        
+
+        col_names = [column['name'] for column in columns]
+
+        # Load the whole file as strings; the pyarrow engine parses
+        # multi-threaded and its string kernels run in C, falling back to
+        # the C engine when pyarrow is unavailable or rejects the file
+        # (e.g. ragged rows). usecols pins every row to the table's shape,
+        # padding short rows and dropping extra trailing fields, and
+        # na_filter=False keeps literal "NA"/"NULL" values as strings so
+        # they still get length-checked
+        try:
+            df = pd.read_csv(csv_file,
+                             sep=delimiter,
+                             header=0 if skip_header else None,
+                             names=col_names,
+                             usecols=list(range(len(columns))),
+                             dtype=str,
+                             na_filter=False,
+                             engine='pyarrow')
+        except (ImportError, ValueError):
+            df = pd.read_csv(csv_file,
+                             sep=delimiter,
+                             header=0 if skip_header else None,
+                             names=col_names,
+                             usecols=list(range(len(columns))),
+                             dtype=str,
+                             na_filter=False,
+                             engine='c')
+
+        # First data row is row 2 of the file when a header was skipped
+        row_offset = 2 if skip_header else 1
+
+        # Check each length-limited character column in vector form
+        for column in columns:
+            if column['data_type'].upper() not in ['VARCHAR', 'NVARCHAR', 'CHAR', 'NCHAR'] or \
+               column['max_length'] <= 0:
+                continue
+
+            lengths = df[column['name']].str.len()
+            bad_index = df.index[lengths > column['max_length']]
+
+            for idx in bad_index:
+                data = df.at[idx, column['name']]
+
+                # Truncate data for display if too long
+                display_data = data[:47] + "..." if len(data) > 50 else data
+
+                problem_rows.append({
+                    'row_number': int(idx) + row_offset,
+                    'column': column['name'],
+                    'data_length': len(data),
+                    'max_allowed': column['max_length'],
+                    'data': display_data
+                })
+
+        # Keep the row-then-column ordering the per-row scan produced
+        problem_rows.sort(key=lambda problem: problem['row_number'])
+
+        logger.info("Checked %s rows, found %s potential issues", len(df), len(problem_rows))
         return problem_rows
 
 
@@ -669,12 +1529,22 @@ def import_to_sql_database(csv_file: str,
                           manage_indexes: bool = False,
                           manage_constraints: bool = False,
                           high_performance_mode: bool = False,
-                          use_pandas: bool = False) -> None:
+                          use_pandas: bool = False,
+                          rows_per_batch: Optional[int] = None,
+                          kilobytes_per_batch: Optional[int] = None,
+                          presorted: bool = False,
+                          csv_stream: Optional[Any] = None,
+                          use_bulk_copy: bool = False,
+                          use_stdlib_csv: bool = False,
+                          use_arrow: bool = False,
+                          use_dask: bool = False,
+                          commit_size: int = 1,
+                          data_source: Optional[str] = None) -> None:
     """
     Import data from a CSV file into a SQL Server table.
-    
+
     Args:
-        csv_file: Path to CSV file
+        csv_file: Path to CSV file (ignored when csv_stream is given)
         sql_server: SQL Server instance name or IP address
         database: Database name
         table: Table name
@@ -695,6 +1565,26 @@ def import_to_sql_database(csv_file: str,
         manage_constraints: Whether to disable and re-enable constraints
         high_performance_mode: Whether to enable high-performance mode
         use_pandas: Whether to use pandas for import (good for AWS environments)
+        rows_per_batch: Approximate row count hint passed to BULK INSERT
+        kilobytes_per_batch: Approximate kilobytes-per-batch hint for BULK INSERT
+        presorted: Whether the file is pre-sorted on the table's clustered key
+        csv_stream: Open text stream of CSV lines to import instead of a
+            file, fed directly into batched INSERTs without touching disk
+        use_bulk_copy: Whether to push the data through the bcp utility's
+            TDS bulk-load path instead of parameterized INSERTs; falls back
+            to the INSERT paths when bcp is not installed
+        use_stdlib_csv: Whether to read the file with the stdlib csv reader
+            into batched INSERTs, skipping DataFrame construction entirely
+        use_arrow: Whether to parse the file with PyArrow's multi-threaded
+            CSV reader; falls back to the chunked pandas path when pyarrow
+            is not installed
+        use_dask: Whether to parse and insert blocksize partitions in
+            parallel with dask.dataframe; falls back to the chunked pandas
+            path when dask is not installed
+        commit_size: Batches per commit on the streamed-insert path
+        data_source: Name of an EXTERNAL DATA SOURCE the SQL Server reads
+            the file from itself; csv_file is then the object key and no
+            data moves through this process at all
     """
     # Apply high performance mode settings if enabled
     if high_performance_mode:
@@ -717,31 +1607,439 @@ def import_to_sql_database(csv_file: str,
     importer.batch_size = batch_size
     importer.timeout = timeout
     
-    if use_pandas:
-        # Use pandas for import (better for AWS environments)
-        importer.import_with_pandas(
-            csv_file=csv_file,
+    # One connection for the whole import, closed when the block exits
+    with importer:
+        if data_source is not None:
+            # The server fetches and parses the object itself; this process
+            # only issues the statement, so no bytes flow through it
+            importer.import_bulk_insert(
+                csv_file=csv_file,
+                table=table,
+                delimiter=delimiter,
+                skip_header=first_row_columns or skip_header_row,
+                truncate=truncate,
+                manage_constraints=manage_constraints,
+                manage_indexes=manage_indexes,
+                rows_per_batch=rows_per_batch,
+                kilobytes_per_batch=kilobytes_per_batch,
+                presorted=presorted,
+                data_source=data_source
+            )
+        elif use_bulk_copy:
+            # TDS bulk-load packets replace one round-trip per INSERT batch;
+            # bcp reads client-side, so this works from Lambda against RDS
+            try:
+                importer.import_with_bcp(
+                    csv_source=csv_stream if csv_stream is not None else csv_file,
+                    table=table,
+                    delimiter=delimiter,
+                    skip_header=first_row_columns or skip_header_row,
+                    truncate=truncate
+                )
+                return
+            except FileNotFoundError:
+                logger.warning("bcp executable not found; "
+                               "falling back to parameterized INSERTs")
+
+        if csv_stream is not None or use_stdlib_csv:
+            # Consume the stream (or the file itself) row by row; nothing is
+            # staged on disk and no DataFrame is built
+            importer.import_from_stream(
+                csv_stream=csv_stream if csv_stream is not None else csv_file,
+                table=table,
+                delimiter=delimiter,
+                skip_header=first_row_columns or skip_header_row,
+                truncate=truncate,
+                batch_size=batch_size,
+                commit_size=commit_size
+            )
+        elif use_dask:
+            # Partition-parallel parse and insert when dask is available;
+            # fall back to the chunked pandas path otherwise
+            try:
+                importer.import_with_dask(
+                    csv_file=csv_file,
+                    table=table,
+                    delimiter=delimiter,
+                    skip_header=first_row_columns or skip_header_row,
+                    truncate=truncate
+                )
+            except ImportError:
+                importer.import_with_pandas(
+                    csv_file=csv_file,
+                    table=table,
+                    delimiter=delimiter,
+                    skip_header=first_row_columns or skip_header_row,
+                    truncate=truncate,
+                    chunksize=batch_size
+                )
+        elif use_arrow:
+            # Prefer the multi-threaded Arrow parser when available; fall
+            # back to the chunked pandas path otherwise
+            try:
+                importer.import_with_arrow(
+                    csv_file=csv_file,
+                    table=table,
+                    delimiter=delimiter,
+                    skip_header=first_row_columns or skip_header_row,
+                    truncate=truncate
+                )
+            except ImportError:
+                importer.import_with_pandas(
+                    csv_file=csv_file,
+                    table=table,
+                    delimiter=delimiter,
+                    skip_header=first_row_columns or skip_header_row,
+                    truncate=truncate,
+                    chunksize=batch_size
+                )
+        elif use_pandas:
+            # Prefer the bcpandas bulk-copy path when the package is available;
+            # fall back to the ODBC insert path otherwise
+            try:
+                importer.import_with_bcpandas(
+                    csv_file=csv_file,
+                    table=table,
+                    delimiter=delimiter,
+                    skip_header=first_row_columns or skip_header_row,
+                    truncate=truncate
+                )
+            except ImportError:
+                # Use pandas for import (better for AWS environments)
+                importer.import_with_pandas(
+                    csv_file=csv_file,
+                    table=table,
+                    delimiter=delimiter,
+                    skip_header=first_row_columns or skip_header_row,
+                    truncate=truncate,
+                    chunksize=batch_size
+                )
+        else:
+            # Use bulk insert for import
+            importer.import_bulk_insert(
+                csv_file=csv_file,
+                table=table,
+                delimiter=delimiter,
+                skip_header=first_row_columns or skip_header_row,
+                truncate=truncate,
+                handle_trailing_delimiters=True,
+                manage_constraints=manage_constraints,
+                manage_indexes=manage_indexes,
+                rows_per_batch=rows_per_batch,
+                kilobytes_per_batch=kilobytes_per_batch,
+                presorted=presorted,
+                check_constraints=check_constraints,
+                keep_nulls=keep_nulls,
+                keep_identity=keep_identity
+            )
+
+
+def import_many(csv_files: List[str],
+                sql_server: str,
+                database: str,
+                table: str,
+                max_workers: Optional[int] = None,
+                **import_kwargs: Any) -> None:
+    """
+    Import multiple CSV files into a SQL Server table in parallel.
+
+    Each file is imported in its own worker process with its own connection,
+    since pyodbc connections are not safe to share across processes.
+
+    Args:
+        csv_files: Paths of the CSV files to import
+        sql_server: SQL Server instance name or IP address
+        database: Database name
+        table: Table name
+        max_workers: Number of worker processes (defaults to the CPU count)
+        **import_kwargs: Additional keyword arguments for import_to_sql_database
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count()
+
+    start_time = time.time()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                import_to_sql_database,
+                csv_file=csv_file,
+                sql_server=sql_server,
+                database=database,
+                table=table,
+                **import_kwargs
+            ): csv_file
+            for csv_file in csv_files
+        }
+
+        errors = []
+        for future in concurrent.futures.as_completed(futures):
+            csv_file = futures[future]
+            try:
+                future.result()
+                logger.info("Imported %s", csv_file)
+            except Exception as e:
+                logger.error("Error importing %s: %s", csv_file, e)
+                errors.append((csv_file, e))
+
+    total_time = time.time() - start_time
+    logger.info("Imported %s of %s files in %.2f seconds",
+                len(csv_files) - len(errors), len(csv_files), total_time)
+
+    if errors:
+        raise errors[0][1]
+
+
+def import_s3_prefix(s3_bucket: str,
+                     prefix: str,
+                     sql_server: str,
+                     database: str,
+                     table: str,
+                     max_concurrency: int = 8,
+                     **import_kwargs: Any) -> None:
+    """
+    Import every CSV object under an S3 prefix into a table concurrently.
+
+    Each object is streamed into the database on its own thread with its own
+    connection, overlapping one object's download with another's inserts;
+    sequential processing would leave the network idle during inserts and
+    the database idle during downloads. Threads suffice here because the
+    work is network and database I/O, not Python CPU.
+
+    Args:
+        s3_bucket: S3 bucket name
+        prefix: Key prefix to list objects under
+        sql_server: SQL Server instance name or IP address
+        database: Database name
+        table: Table name
+        max_concurrency: Concurrent imports (keep below the server's
+            connection headroom)
+        **import_kwargs: Additional keyword arguments for
+            import_to_sql_database
+    """
+    import gzip
+    import io
+
+    s3 = _get_s3_client()
+    keys = []
+    paginator = s3.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=s3_bucket, Prefix=prefix):
+        keys += [item['Key'] for item in page.get('Contents', [])
+                 if not item['Key'].endswith('/')]
+
+    if not keys:
+        logger.warning("No objects found under s3://%s/%s", s3_bucket, prefix)
+        return
+
+    start_time = time.time()
+
+    # Truncate once up front rather than letting each worker wipe out the
+    # rows the others already loaded
+    if import_kwargs.pop('truncate', False):
+        importer = SqlImport(
+            server=sql_server,
+            database=database,
+            username=import_kwargs.get('username'),
+            password=import_kwargs.get('password'),
+            trusted_connection=import_kwargs.get('trusted_connection', False)
+        )
+        with importer:
+            importer.truncate_table(table)
+
+    def _import_one(key):
+        body = s3.get_object(Bucket=s3_bucket, Key=key)['Body']
+        if key.endswith('.gz'):
+            body = gzip.GzipFile(fileobj=body)
+        with io.TextIOWrapper(body, encoding='utf-8', newline='') as stream:
+            import_to_sql_database(
+                csv_file='',
+                sql_server=sql_server,
+                database=database,
+                table=table,
+                csv_stream=stream,
+                **import_kwargs
+            )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = {executor.submit(_import_one, key): key for key in keys}
+
+        errors = []
+        for future in concurrent.futures.as_completed(futures):
+            key = futures[future]
+            try:
+                future.result()
+                logger.info("Imported %s", key)
+            except Exception as e:
+                logger.error("Error importing %s: %s", key, e)
+                errors.append((key, e))
+
+    total_time = time.time() - start_time
+    logger.info("Imported %s of %s objects in %.2f seconds",
+                len(keys) - len(errors), len(keys), total_time)
+
+    if errors:
+        raise errors[0][1]
+
+
+def _import_shard(csv_file: str,
+                  sql_server: str,
+                  database: str,
+                  table: str,
+                  delimiter: str,
+                  start: int,
+                  end: int,
+                  skip_header: bool,
+                  username: Optional[str],
+                  password: Optional[str],
+                  trusted_connection: bool) -> None:
+    """
+    Parse and insert one byte range of a CSV file (worker for import_sharded).
+
+    The shard owns every row that starts in [start, end). Seeking to
+    start - 1 and discarding one line snaps to the next row boundary without
+    double-counting rows when a boundary lands exactly on a newline.
+    """
+    importer = SqlImport(
+        server=sql_server,
+        database=database,
+        username=username,
+        password=password,
+        trusted_connection=trusted_connection
+    )
+
+    with importer, open(csv_file, 'rb', buffering=1 << 20) as f:
+        if start > 0:
+            f.seek(start - 1)
+            f.readline()
+        elif skip_header:
+            f.readline()
+
+        def shard_lines():
+            while f.tell() < end:
+                line = f.readline()
+                if not line:
+                    break
+                yield line.decode('utf-8')
+
+        importer.import_from_stream(
+            csv_stream=shard_lines(),
             table=table,
-            delimiter=delimiter,
-            skip_header=first_row_columns or skip_header_row,
-            truncate=truncate,
-            chunksize=batch_size
+            delimiter=delimiter
         )
-    else:
-        # Use bulk insert for import
-        importer.import_bulk_insert(
+
+
+def import_sharded(csv_file: str,
+                   sql_server: str,
+                   database: str,
+                   table: str,
+                   delimiter: str = ",",
+                   skip_header: bool = False,
+                   truncate: bool = False,
+                   username: Optional[str] = None,
+                   password: Optional[str] = None,
+                   trusted_connection: bool = False,
+                   max_workers: Optional[int] = None) -> None:
+    """
+    Import one large CSV file by parsing and inserting byte-range shards in
+    parallel.
+
+    The file is split into cpu-count byte ranges snapped to row boundaries;
+    each worker process parses its own shard and streams it over its own
+    connection, so parse and insert scale with cores. Files containing
+    quoted fields are imported single-process, since a quoted newline would
+    break the byte-range row splitter.
+
+    Args:
+        csv_file: Path to CSV file
+        sql_server: SQL Server instance name or IP address
+        database: Database name
+        table: Table name
+        delimiter: Field delimiter character
+        skip_header: Whether to skip the header row
+        truncate: Whether to truncate the table before import
+        username: SQL Server username (if not using Windows auth)
+        password: SQL Server password (if not using Windows auth)
+        trusted_connection: Whether to use Windows authentication
+        max_workers: Number of worker processes (defaults to the CPU count)
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count()
+
+    size = os.path.getsize(csv_file)
+
+    # Quoted fields can hide newlines, which the byte-range splitter cannot
+    # see; one sequential pass over the whole file finds any quote byte
+    # (a head-only sniff would miss a quoted newline later in the file and
+    # silently corrupt the split rows)
+    has_quotes = False
+    if max_workers >= 2 and size >= 1 << 20:
+        with open(csv_file, 'rb') as f:
+            while True:
+                block = f.read(1 << 23)
+                if not block:
+                    break
+                if b'"' in block:
+                    has_quotes = True
+                    break
+    if has_quotes or max_workers < 2 or size < 1 << 20:
+        import_to_sql_database(
             csv_file=csv_file,
+            sql_server=sql_server,
+            database=database,
             table=table,
             delimiter=delimiter,
-            skip_header=first_row_columns or skip_header_row,
+            skip_header_row=skip_header,
             truncate=truncate,
-            handle_trailing_delimiters=True,
-            manage_constraints=manage_constraints,
-            manage_indexes=manage_indexes
+            username=username,
+            password=password,
+            trusted_connection=trusted_connection,
+            use_stdlib_csv=True
         )
+        return
 
+    start_time = time.time()
 
-def find_problem_data(csv_file: str, 
+    # Truncate once up front rather than racing the workers over it
+    if truncate:
+        importer = SqlImport(
+            server=sql_server,
+            database=database,
+            username=username,
+            password=password,
+            trusted_connection=trusted_connection
+        )
+        with importer:
+            importer.truncate_table(table)
+
+    bounds = [i * size // max_workers for i in range(max_workers)] + [size]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _import_shard,
+                csv_file=csv_file,
+                sql_server=sql_server,
+                database=database,
+                table=table,
+                delimiter=delimiter,
+                start=bounds[i],
+                end=bounds[i + 1],
+                skip_header=skip_header,
+                username=username,
+                password=password,
+                trusted_connection=trusted_connection
+            )
+            for i in range(max_workers)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+
+    total_time = time.time() - start_time
+    logger.info("Sharded import of %s completed in %.2f seconds across %s workers",
+                csv_file, total_time, max_workers)
+
+
+def find_problem_data(csv_file: str,
                      sql_server: str, 
                      database: str, 
                      table: str, 
@@ -774,20 +2072,38 @@ def find_problem_data(csv_file: str,
         trusted_connection=trusted_connection
     )
     
-    # Connect to database
-    importer.connect()
-    
-    try:
-        # Find problem data
+    # Find problem data over a single connection
+    with importer:
         return importer.find_problem_data(
             csv_file=csv_file,
             table=table,
             delimiter=delimiter,
             skip_header=True
         )
-    finally:
-        # Ensure connection is closed
-        importer.disconnect()
+
+
+# S3 client shared across warm Lambda invocations; building one per call
+# repeats credential resolution, endpoint discovery, and the TLS handshake
+_s3_client = None
+
+
+def _get_s3_client():
+    """Return a lazily created, module-scoped S3 client."""
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+        import botocore.config
+        # Lambda and Glue already know their region; passing it skips the
+        # endpoint-discovery round-trip on the first call
+        region = os.environ.get('AWS_REGION') or os.environ.get('AWS_DEFAULT_REGION')
+        _s3_client = boto3.client('s3', region_name=region, config=botocore.config.Config(
+            max_pool_connections=50,
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            tcp_keepalive=True,
+            signature_version='s3v4',
+            s3={'addressing_style': 'virtual'}
+        ))
+    return _s3_client
 
 
 # AWS Lambda handler example
@@ -808,11 +2124,15 @@ def lambda_handler(event, context):
         "username": "my_username",
         "password": "my_password"
     }
+
+    An optional "data_source" names an EXTERNAL DATA SOURCE on the SQL
+    Server covering the bucket; the server then bulk-loads the object
+    itself and no data moves through Lambda.
     """
-    import boto3
-    import os
-    
-    logger.info(f"Received event: {event}")
+    import gzip
+    import io
+
+    logger.info("Received event: %s", event)
     
     # Extract parameters from event
     s3_bucket = event.get('s3_bucket')
@@ -835,24 +2155,98 @@ def lambda_handler(event, context):
             "body": message
         }
     
-    # Download file from S3
-    local_file = f"/tmp/{os.path.basename(s3_key)}"
+    # When the server has an external data source over the bucket (one-time
+    # DBA setup), hand it the key and let it bulk-load server-side; Lambda
+    # is reduced to issuing the statement
+    data_source = event.get('data_source')
+    if data_source:
+        try:
+            import_to_sql_database(
+                csv_file=s3_key,
+                sql_server=sql_server,
+                database=database,
+                table=table,
+                delimiter=delimiter,
+                skip_header_row=skip_header,
+                truncate=truncate,
+                username=username,
+                password=password,
+                trusted_connection=False,
+                data_source=data_source
+            )
+            return {
+                "statusCode": 200,
+                "body": f"Successfully imported {s3_key} to {table}"
+            }
+        except Exception as e:
+            message = f"Error importing data: {e}"
+            logger.error(message)
+            return {
+                "statusCode": 500,
+                "body": message
+            }
+
+    # Default path fuses download, parse, and insert into one pass: the
+    # object body feeds csv.reader directly and each batch goes out as it
+    # fills, so the file's bytes are touched once and peak memory is one
+    # batch. Setting "buffer_object" in the event instead spools the object
+    # (parallel ranged GETs, RAM up to the cap, disk beyond) for cases where
+    # S3 throughput should be decoupled from insert throughput
     try:
-        s3 = boto3.client('s3')
-        s3.download_file(s3_bucket, s3_key, local_file)
-        logger.info(f"Downloaded {s3_key} from {s3_bucket} to {local_file}")
+        s3 = _get_s3_client()
+
+        # Scale the insert batch to the function's memory: estimate bytes
+        # per row from the head of the object and size the batch so one
+        # batch of decoded rows stays well under the available RAM (Python
+        # string and list overhead runs several times the raw CSV bytes,
+        # hence the extra factor of 8 on top of the 1/8-of-memory budget)
+        memory = int(os.environ.get('AWS_LAMBDA_FUNCTION_MEMORY_SIZE', 512)) * 1024 * 1024
+        # An explicit batch_size in the event overrides the auto-tuned value
+        batch_size = event.get('batch_size')
+        if batch_size is None:
+            if s3_key.endswith('.gz'):
+                # Compressed head bytes say nothing about decoded row width
+                batch_size = 10000
+            else:
+                sample = s3.get_object(Bucket=s3_bucket, Key=s3_key,
+                                       Range='bytes=0-65535')['Body'].read()
+                row_bytes = max(1, len(sample) // max(1, sample.count(b'\n')))
+                batch_size = max(1000, min(200000, memory // 8 // (row_bytes * 8)))
+        commit_size = event.get('commit_size', 1)
+        logger.info("Using batch size %s", batch_size)
+
+        if event.get('buffer_object', False):
+            from boto3.s3.transfer import TransferConfig
+
+            transfer_config = TransferConfig(
+                multipart_threshold=8 * 1024 * 1024,
+                multipart_chunksize=16 * 1024 * 1024,
+                max_concurrency=10,
+                use_threads=True
+            )
+            body = tempfile.SpooledTemporaryFile(max_size=256 * 1024 * 1024)
+            s3.download_fileobj(s3_bucket, s3_key, body, Config=transfer_config)
+            body.seek(0)
+            logger.info("Buffered %s from %s", s3_key, s3_bucket)
+        else:
+            body = s3.get_object(Bucket=s3_bucket, Key=s3_key)['Body']
+            logger.info("Streaming %s from %s", s3_key, s3_bucket)
+
+        if s3_key.endswith('.gz'):
+            body = gzip.GzipFile(fileobj=body)
+        csv_stream = io.TextIOWrapper(body, encoding='utf-8', newline='')
     except Exception as e:
-        message = f"Error downloading file from S3: {e}"
+        message = f"Error opening file from S3: {e}"
         logger.error(message)
         return {
             "statusCode": 500,
             "body": message
         }
-    
+
     # Import data
     try:
         import_to_sql_database(
-            csv_file=local_file,
+            csv_file='',
             sql_server=sql_server,
             database=database,
             table=table,
@@ -862,9 +2256,12 @@ def lambda_handler(event, context):
             username=username,
             password=password,
             trusted_connection=False,
-            use_pandas=True  # Better for AWS Lambda
+            batch_size=batch_size,
+            commit_size=commit_size,
+            csv_stream=csv_stream,
+            use_bulk_copy=True
         )
-        
+
         return {
             "statusCode": 200,
             "body": f"Successfully imported {s3_key} to {table}"
@@ -877,10 +2274,7 @@ def lambda_handler(event, context):
             "body": message
         }
     finally:
-        # Clean up temp file
-        if os.path.exists(local_file):
-            os.remove(local_file)
-            logger.info(f"Removed temporary file: {local_file}")
+        csv_stream.close()
 
 
 # AWS Glue job script example
@@ -892,7 +2286,6 @@ def glue_job_sample():
     Note: This is a sample script. In a real Glue job, you would typically define arguments in the job configuration.
     """
     import sys
-    from awsglue.transforms import *
     from awsglue.utils import getResolvedOptions
     from pyspark.context import SparkContext
     from awsglue.context import GlueContext
@@ -930,83 +2323,123 @@ def glue_job_sample():
     username = args['username']
     password = args['password']
     
-    # Download file from S3 to local temp storage
-    import boto3
-    import os
-    import tempfile
-    
+    # Stream the file from S3 rather than staging it on local disk
+    import gzip
+    import io
+
     # Extract bucket and key from S3 path
     s3_parts = s3_source_path.replace('s3://', '').split('/', 1)
     s3_bucket = s3_parts[0]
     s3_key = s3_parts[1] if len(s3_parts) > 1 else ''
-    
-    # Create temp file
-    fd, local_file = tempfile.mkstemp(suffix='.csv')
-    os.close(fd)
-    
+
     try:
-        # Download file
-        s3 = boto3.client('s3')
-        s3.download_file(s3_bucket, s3_key, local_file)
-        logger.info(f"Downloaded {s3_key} from {s3_bucket} to {local_file}")
-        
-        # Import data to SQL Server
-        import_to_sql_database(
-            csv_file=local_file,
-            sql_server=sql_server,
-            database=database,
-            table=table,
-            delimiter=delimiter,
-            skip_header_row=skip_header,
-            truncate=truncate,
-            username=username,
-            password=password,
-            trusted_connection=False,
-            use_pandas=True  # Better for AWS environments
+        from boto3.s3.transfer import TransferConfig
+
+        # A trailing slash means a prefix of many CSVs: import them
+        # concurrently, overlapping downloads with inserts
+        if s3_key.endswith('/'):
+            import_s3_prefix(
+                s3_bucket=s3_bucket,
+                prefix=s3_key,
+                sql_server=sql_server,
+                database=database,
+                table=table,
+                delimiter=delimiter,
+                skip_header_row=skip_header,
+                truncate=truncate,
+                username=username,
+                password=password,
+                trusted_connection=False
+            )
+            logger.info("Successfully imported s3://%s/%s to %s",
+                        s3_bucket, s3_key, table)
+            job.commit()
+            return
+
+        s3 = _get_s3_client()
+        # Glue workers have more cores and bandwidth than Lambda, so drive
+        # more ranged GETs in parallel
+        transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=32,
+            use_threads=True
         )
-        
-        logger.info(f"Successfully imported {s3_key} to {table}")
-        
+        buf = tempfile.SpooledTemporaryFile(max_size=256 * 1024 * 1024)
+        s3.download_fileobj(s3_bucket, s3_key, buf, Config=transfer_config)
+        buf.seek(0)
+        body = gzip.GzipFile(fileobj=buf) if s3_key.endswith('.gz') else buf
+        csv_stream = io.TextIOWrapper(body, encoding='utf-8')
+        logger.info("Buffered %s from %s", s3_key, s3_bucket)
+
+        # Import data to SQL Server
+        with csv_stream:
+            import_to_sql_database(
+                csv_file='',
+                sql_server=sql_server,
+                database=database,
+                table=table,
+                delimiter=delimiter,
+                skip_header_row=skip_header,
+                truncate=truncate,
+                username=username,
+                password=password,
+                trusted_connection=False,
+                csv_stream=csv_stream,
+                use_bulk_copy=True
+            )
+
+        logger.info("Successfully imported %s to %s", s3_key, table)
+
     except Exception as e:
-        logger.error(f"Error in Glue job: {e}")
+        logger.error("Error in Glue job: %s", e)
         raise
-    finally:
-        # Clean up temp file
-        if os.path.exists(local_file):
-            os.remove(local_file)
-            logger.info(f"Removed temporary file: {local_file}")
-    
+
     # End job
     job.commit()
 
 
 # Example usage in a standalone script
-if __name__ == "__main__":
+# CLI flags as data; the parser is only assembled when the script actually
+# runs from the command line, keeping module import free of argparse work
+_CLI_FLAGS = {
+    '--csv-file': dict(required=True, help='Path to CSV file'),
+    '--server': dict(required=True, help='SQL Server instance'),
+    '--database': dict(required=True, help='Database name'),
+    '--table': dict(required=True, help='Table name'),
+    '--delimiter': dict(default=',', help='CSV delimiter'),
+    '--username': dict(help='SQL Server username'),
+    '--password': dict(help='SQL Server password'),
+    '--trusted-connection': dict(action='store_true', help='Use Windows authentication'),
+    '--first-row-columns': dict(action='store_true', help='First row contains column headers'),
+    '--skip-header-row': dict(action='store_true', help='Skip header row'),
+    '--truncate': dict(action='store_true', help='Truncate table before import'),
+    '--manage-indexes': dict(action='store_true', help='Disable and rebuild indexes'),
+    '--manage-constraints': dict(action='store_true', help='Disable and re-enable constraints'),
+    '--high-performance': dict(action='store_true', help='Enable high-performance mode'),
+    '--use-pandas': dict(action='store_true', help='Use pandas for import'),
+    '--batch-size': dict(type=int, default=5000, help='Rows per insert batch'),
+    '--commit-size': dict(type=int, default=1, help='Insert batches per commit'),
+    '--find-problems': dict(action='store_true', help='Find problem data instead of importing'),
+    '--log-level': dict(default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+                        help='Set logging level'),
+}
+
+
+def _build_parser():
+    """Assemble the argument parser from the flag table."""
     import argparse
-    
-    # Parse command line arguments
+
     parser = argparse.ArgumentParser(description='Import CSV data to SQL Server.')
-    parser.add_argument('--csv-file', required=True, help='Path to CSV file')
-    parser.add_argument('--server', required=True, help='SQL Server instance')
-    parser.add_argument('--database', required=True, help='Database name')
-    parser.add_argument('--table', required=True, help='Table name')
-    parser.add_argument('--delimiter', default=',', help='CSV delimiter')
-    parser.add_argument('--username', help='SQL Server username')
-    parser.add_argument('--password', help='SQL Server password')
-    parser.add_argument('--trusted-connection', action='store_true', help='Use Windows authentication')
-    parser.add_argument('--first-row-columns', action='store_true', help='First row contains column headers')
-    parser.add_argument('--skip-header-row', action='store_true', help='Skip header row')
-    parser.add_argument('--truncate', action='store_true', help='Truncate table before import')
-    parser.add_argument('--manage-indexes', action='store_true', help='Disable and rebuild indexes')
-    parser.add_argument('--manage-constraints', action='store_true', help='Disable and re-enable constraints')
-    parser.add_argument('--high-performance', action='store_true', help='Enable high-performance mode')
-    parser.add_argument('--use-pandas', action='store_true', help='Use pandas for import')
-    parser.add_argument('--find-problems', action='store_true', help='Find problem data instead of importing')
-    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'], 
-                      help='Set logging level')
-    
-    args = parser.parse_args()
-    
+    for flag, options in _CLI_FLAGS.items():
+        parser.add_argument(flag, **options)
+    return parser
+
+
+if __name__ == "__main__":
+    # Parse command line arguments
+    args = _build_parser().parse_args()
+
     # Set logging level
     logger.setLevel(getattr(logging, args.log_level))
     
@@ -1045,8 +2478,10 @@ if __name__ == "__main__":
             username=args.username,
             password=args.password,
             trusted_connection=args.trusted_connection,
+            batch_size=args.batch_size,
             manage_indexes=args.manage_indexes,
             manage_constraints=args.manage_constraints,
             high_performance_mode=args.high_performance,
-            use_pandas=args.use_pandas
+            use_pandas=args.use_pandas,
+            commit_size=args.commit_size
         )
\ No newline at end of file